@@ -3,11 +3,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+import struct
 
 import voluptuous as vol
-from bleak import BleakClient, BleakScanner
+from bleak import BleakClient
+from bleak_retry_connector import (
+    BleakClientWithServiceCache,
+    establish_connection,
+)
 import homeassistant.helpers.config_validation as cv
+from homeassistant.components.bluetooth import async_ble_device_from_address
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
@@ -26,12 +31,10 @@ from .const import (
     ESC_INIT,
     ESC_ALIGN_LEFT,
     ESC_ALIGN_CENTER,
-    ESC_ALIGN_RIGHT,
-    ESC_BOLD_ON,
-    ESC_BOLD_OFF,
-    ESC_SIZE_NORMAL,
-    ESC_SIZE_LARGE,
     ESC_LINE_FEED,
+    PROLOGUE,
+    DEFAULT_PROLOGUE,
+    EPILOGUE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +62,64 @@ FEED_PAPER_SCHEMA = vol.Schema({
     vol.Optional("lines", default=3): vol.Range(min=1, max=10),
 })
 
+# Keep the GATT session open this long after the last print so
+# back-to-back jobs share one connection setup. Printing is bursty, so
+# a short window frees the radio for scanning and WLAN coexistence;
+# reconnecting is cheap (~150-300 ms) with cached services
+IDLE_DISCONNECT_SECONDS = 15
+
+# Pre-instantiated packers for ESC/POS length fields
+_PACK_U16LE = struct.Struct('<H').pack  # QR data length (little-endian)
+_PACK_U8 = struct.Struct('<B').pack  # single-byte parameters
+
+# Precomputed ESC/POS templates: everything up to the first variable
+# slot is a single constant, so building a job is a handful of joins
+_QR_PREFIX = (
+    ESC_INIT
+    + ESC_ALIGN_CENTER  # center the QR code
+    + b'\x1D\x28\x6B\x04\x00\x31\x41\x32\x00'  # QR model 2
+    + b'\x1D\x28\x6B\x03\x00\x31\x43'  # module size follows
+)
+_QR_EC = b'\x1D\x28\x6B\x03\x00\x31\x45\x30'  # error correction level L
+_QR_STORE_HDR = b'\x1D\x28\x6B'  # store data; u16le length follows
+_QR_STORE_FN = b'\x31\x50\x30'
+_QR_PRINT = b'\x1D\x28\x6B\x03\x00\x31\x51\x30'  # print stored symbol
+
+_BARCODE_PREFIX = (
+    ESC_INIT
+    + ESC_ALIGN_CENTER  # center the barcode
+    + b'\x1D\x68\x64'  # height = 100 dots
+    + b'\x1D\x77\x02'  # width = 2
+    + b'\x1D\x48\x02'  # HRI text below barcode
+)
+_BARCODE_CODE128 = b'\x1D\x6B\x49'  # CODE128; u8 length follows
+
+
+def _build_qr(data: bytes, size: int) -> bytes:
+    """Build the complete ESC/POS command stream for a QR code."""
+    return b''.join((
+        _QR_PREFIX,
+        _PACK_U8(size),
+        _QR_EC,
+        _QR_STORE_HDR,
+        _PACK_U16LE(len(data) + 3),
+        _QR_STORE_FN,
+        data,
+        _QR_PRINT,
+        ESC_ALIGN_LEFT,
+    ))
+
+
+def _build_barcode(data: bytes) -> bytes:
+    """Build the complete ESC/POS command stream for a CODE128 barcode."""
+    return b''.join((
+        _BARCODE_PREFIX,
+        _BARCODE_CODE128,
+        _PACK_U8(len(data)),
+        data,
+        ESC_ALIGN_LEFT,
+    ))
+
 
 class ThermalPrinterCoordinator(DataUpdateCoordinator):
     """Coordinator for thermal printer."""
@@ -69,35 +130,112 @@ class ThermalPrinterCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            # No polling: there is nothing to fetch from the printer, and a
+            # BLE connect every 30 s would burn radio time on both sides.
+            # We reconnect lazily when a print service is called.
+            update_interval=None,
         )
         self.mac_address = mac_address
         self.client: BleakClient | None = None
         self.is_connected = False
+        self._write_without_response = False
+        self._tx_char = None
+        self._max_write: int | None = None
+        self._conn_lock = asyncio.Lock()
+        self._idle_task: asyncio.Task | None = None
+        self._last_use = 0.0
+        # Print services enqueue payloads; a single pump task drains the
+        # queue so back-to-back jobs share one connection and write stream
+        self._tx_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._pump_task: asyncio.Task | None = hass.loop.create_task(
+            self._tx_pump()
+        )
 
     async def _async_update_data(self):
-        """Update data via library."""
-        try:
-            if not self.is_connected:
-                await self._connect()
-            return {"connected": self.is_connected, "mac_address": self.mac_address}
-        except Exception as err:
-            _LOGGER.error("Error updating data: %s", err)
-            self.is_connected = False
-            return {"connected": False, "mac_address": self.mac_address}
+        """Report connection status; connects happen lazily on print."""
+        return {"connected": self.is_connected, "mac_address": self.mac_address}
 
-    async def _connect(self):
-        """Connect to the thermal printer."""
+    def _on_disconnect(self, client: BleakClient) -> None:
+        """Handle the printer dropping the connection."""
+        _LOGGER.debug("Thermal printer %s disconnected", self.mac_address)
+        self.is_connected = False
+        self._tx_char = None
+        self._max_write = None
+
+    def _cancel_idle_disconnect(self) -> None:
+        """Cancel a pending idle disconnect, if any."""
+        if self._idle_task and not self._idle_task.done():
+            self._idle_task.cancel()
+        self._idle_task = None
+
+    def _schedule_idle_disconnect(self) -> None:
+        """Disconnect after an idle period unless a new job arrives first."""
+        self._last_use = self.hass.loop.time()
+        self._cancel_idle_disconnect()
+        self._idle_task = asyncio.create_task(
+            self._close_after(IDLE_DISCONNECT_SECONDS)
+        )
+
+    async def _close_after(self, delay: float) -> None:
+        """Disconnect once the link has been idle for `delay` seconds."""
+        await asyncio.sleep(delay)
+        # Tear down under the connection lock so a job arriving mid-teardown
+        # waits in _ensure_connected and reconnects, instead of seeing a
+        # still-connected client and writing into a half-closed link
+        async with self._conn_lock:
+            if self.hass.loop.time() - self._last_use < delay:
+                # A job slipped in meanwhile; its own idle timer is pending
+                return
+            self._idle_task = None  # avoid disconnect() cancelling this task
+            await self.disconnect()
+
+    async def _ensure_connected(self):
+        """Connect to the thermal printer if not already connected."""
         try:
-            if self.client and self.client.is_connected:
+            async with self._conn_lock:
+                self._cancel_idle_disconnect()
+
+                if self.client and self.client.is_connected:
+                    return True
+
+                # establish_connection retries with backoff, shares the
+                # adapter sanely and caches discovered services, so a
+                # reconnect skips the 300-800 ms service discovery
+                ble_device = async_ble_device_from_address(
+                    self.hass, self.mac_address, connectable=True
+                )
+                if ble_device is None:
+                    raise Exception(
+                        f"Printer {self.mac_address} not present"
+                    )
+
+                self.client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    ble_device,
+                    self.mac_address,
+                    disconnected_callback=self._on_disconnect,
+                    use_services_cache=True,
+                )
+                self.is_connected = True
+
+                # Resolve the characteristic once so each write skips the UUID
+                # lookup, and check whether the printer supports
+                # WriteWithoutResponse so we can stream without per-packet ACKs
+                self._tx_char = self.client.services.get_characteristic(
+                    PRINTER_CHARACTERISTIC_UUID
+                )
+                self._write_without_response = (
+                    self._tx_char is not None
+                    and "write-without-response" in self._tx_char.properties
+                )
+                try:
+                    self._max_write = self._tx_char.max_write_without_response_size
+                except Exception:
+                    self._max_write = None
+
+                _LOGGER.info("Connected to thermal printer %s", self.mac_address)
                 return True
 
-            self.client = BleakClient(self.mac_address)
-            await self.client.connect()
-            self.is_connected = True
-            _LOGGER.info("Connected to thermal printer %s", self.mac_address)
-            return True
-
         except Exception as err:
             _LOGGER.error("Failed to connect to printer: %s", err)
             self.is_connected = False
@@ -105,9 +243,44 @@ class ThermalPrinterCoordinator(DataUpdateCoordinator):
 
     async def disconnect(self):
         """Disconnect from printer."""
+        self._cancel_idle_disconnect()
         if self.client and self.client.is_connected:
             await self.client.disconnect()
             self.is_connected = False
+            self._tx_char = None
+            self._max_write = None
+
+    async def shutdown(self):
+        """Stop the sender task and drop the connection."""
+        if self._pump_task:
+            self._pump_task.cancel()
+            self._pump_task = None
+        await self.disconnect()
+
+    def _queue_job(self, payload: bytes) -> None:
+        """Hand a payload to the background sender."""
+        self._tx_queue.put_nowait(payload)
+
+    async def _tx_pump(self):
+        """Drain the print queue, batching whatever has accumulated.
+
+        Concurrent service calls each enqueue their payload; the pump
+        concatenates everything already waiting into one write stream so
+        a burst of jobs costs a single connect and chunk sequence.
+        """
+        while True:
+            parts = [await self._tx_queue.get()]
+            for _ in range(self._tx_queue.qsize()):
+                parts.append(self._tx_queue.get_nowait())
+
+            try:
+                if not await self._ensure_connected():
+                    raise Exception("Cannot connect to printer")
+                await self._send_to_printer(b''.join(parts))
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                _LOGGER.error("Error sending print job: %s", err)
 
     async def print_text(
         self,
@@ -116,170 +289,92 @@ class ThermalPrinterCoordinator(DataUpdateCoordinator):
         alignment: str = "left",
         bold: bool = False,
     ):
-        """Print text to thermal printer."""
-        if not await self._connect():
-            raise Exception("Cannot connect to printer")
-
-        try:
-            # Create ESC/POS commands
-            commands = bytearray()
-            
-            # Initialize printer
-            commands.extend(ESC_INIT)
-            
-            # Set alignment
-            if alignment == "center":
-                commands.extend(ESC_ALIGN_CENTER)
-            elif alignment == "right":
-                commands.extend(ESC_ALIGN_RIGHT)
-            else:
-                commands.extend(ESC_ALIGN_LEFT)
-            
-            # Set font size
-            if font_size == "large":
-                commands.extend(ESC_SIZE_LARGE)
-            else:
-                commands.extend(ESC_SIZE_NORMAL)
-            
-            # Set bold
-            if bold:
-                commands.extend(ESC_BOLD_ON)
-            
-            # Add text (handle encoding properly)
-            try:
-                text_bytes = text.encode('cp850')  # Code page 850 for Latin chars
-            except UnicodeEncodeError:
-                text_bytes = text.encode('utf-8', errors='replace')
-            
-            commands.extend(text_bytes)
-            
-            # Line feed
-            commands.extend(ESC_LINE_FEED)
-            
-            # Reset formatting
-            commands.extend(ESC_BOLD_OFF)
-            commands.extend(ESC_SIZE_NORMAL)
-            commands.extend(ESC_ALIGN_LEFT)
-            
-            # Send to printer via Bluetooth
-            await self._send_to_printer(commands)
-            
-        except Exception as err:
-            _LOGGER.error("Error printing text: %s", err)
-            raise
+        """Queue text for printing."""
+        # Code page 850 for Latin chars; 'replace' swaps unmappable
+        # characters for '?' in a single pass instead of re-encoding
+        # the whole string on a UnicodeEncodeError
+        text_bytes = text.encode('cp850', 'replace')
+
+        # The control header is precomputed per formatting combination;
+        # a single dict lookup replaces the old if/elif chains, falling
+        # back to default formatting for values outside the service schema
+        prologue = PROLOGUE.get(
+            (alignment, font_size, bool(bold)), DEFAULT_PROLOGUE
+        )
+        self._queue_job(prologue + text_bytes + EPILOGUE)
 
     async def print_qr_code(self, data: str, size: int = 6):
-        """Print QR code."""
-        if not await self._connect():
-            raise Exception("Cannot connect to printer")
-
-        try:
-            commands = bytearray()
-            
-            # Initialize
-            commands.extend(ESC_INIT)
-            
-            # Center alignment for QR code
-            commands.extend(ESC_ALIGN_CENTER)
-            
-            # QR Code commands (ESC/POS standard)
-            # Set QR code model
-            commands.extend(b'\x1D\x28\x6B\x04\x00\x31\x41\x32\x00')
-            
-            # Set QR code size
-            commands.extend(b'\x1D\x28\x6B\x03\x00\x31\x43')
-            commands.extend(bytes([size]))
-            
-            # Set error correction level
-            commands.extend(b'\x1D\x28\x6B\x03\x00\x31\x45\x30')
-            
-            # Store QR data
-            data_bytes = data.encode('utf-8')
-            data_len = len(data_bytes) + 3
-            commands.extend(b'\x1D\x28\x6B')
-            commands.extend(data_len.to_bytes(2, 'little'))
-            commands.extend(b'\x31\x50\x30')
-            commands.extend(data_bytes)
-            
-            # Print QR code
-            commands.extend(b'\x1D\x28\x6B\x03\x00\x31\x51\x30')
-            
-            # Reset alignment
-            commands.extend(ESC_ALIGN_LEFT)
-            
-            await self._send_to_printer(commands)
-            
-        except Exception as err:
-            _LOGGER.error("Error printing QR code: %s", err)
-            raise
+        """Queue a QR code for printing."""
+        self._queue_job(_build_qr(data.encode('utf-8'), size))
 
     async def print_barcode(self, data: str, barcode_type: str = "CODE128"):
-        """Print barcode."""
-        if not await self._connect():
-            raise Exception("Cannot connect to printer")
+        """Queue a barcode for printing."""
+        if barcode_type.upper() == "CODE128":
+            commands = _build_barcode(data.encode('ascii'))
+        else:
+            # Unsupported symbology: just the setup/reset, as before
+            commands = _BARCODE_PREFIX + ESC_ALIGN_LEFT
 
-        try:
-            commands = bytearray()
-            
-            # Initialize
-            commands.extend(ESC_INIT)
-            
-            # Center alignment
-            commands.extend(ESC_ALIGN_CENTER)
-            
-            # Set barcode height
-            commands.extend(b'\x1D\x68\x64')  # Height = 100 dots
-            
-            # Set barcode width
-            commands.extend(b'\x1D\x77\x02')  # Width = 2
-            
-            # Set HRI position (Human Readable Interpretation)
-            commands.extend(b'\x1D\x48\x02')  # Below barcode
-            
-            # Print barcode (CODE128 example)
-            if barcode_type.upper() == "CODE128":
-                commands.extend(b'\x1D\x6B\x49')  # CODE128
-                commands.extend(bytes([len(data)]))  # Data length
-                commands.extend(data.encode('ascii'))
-            
-            # Reset alignment
-            commands.extend(ESC_ALIGN_LEFT)
-            
-            await self._send_to_printer(commands)
-            
-        except Exception as err:
-            _LOGGER.error("Error printing barcode: %s", err)
-            raise
+        self._queue_job(commands)
 
     async def feed_paper(self, lines: int = 3):
-        """Feed paper."""
-        if not await self._connect():
-            raise Exception("Cannot connect to printer")
-
-        try:
-            commands = bytearray()
-            for _ in range(lines):
-                commands.extend(ESC_LINE_FEED)
-            
-            await self._send_to_printer(commands)
-            
-        except Exception as err:
-            _LOGGER.error("Error feeding paper: %s", err)
-            raise
+        """Queue a paper feed."""
+        self._queue_job(ESC_LINE_FEED * lines)
 
-    async def _send_to_printer(self, data: bytearray):
+    async def _send_to_printer(self, data: bytes):
         """Send data to printer via Bluetooth."""
         if not self.client or not self.client.is_connected:
             raise Exception("Printer not connected")
 
         try:
-            # Split data into chunks (Bluetooth has packet size limits)
-            chunk_size = 20
-            for i in range(0, len(data), chunk_size):
-                chunk = data[i:i + chunk_size]
-                await self.client.write_gatt_char(PRINTER_CHARACTERISTIC_UUID, chunk)
-                await asyncio.sleep(0.05)  # Small delay between chunks
-                
+            # Use the characteristic handle resolved at connect time so
+            # bleak does not re-resolve the UUID string on every write
+            char = self._tx_char or PRINTER_CHARACTERISTIC_UUID
+
+            # Split data into chunks sized to the negotiated MTU; modern
+            # stacks negotiate 185-244 bytes so most labels need few packets
+            if self._max_write:
+                chunk_size = self._max_write
+            else:
+                try:
+                    chunk_size = self.client.mtu_size - 3
+                except Exception:
+                    chunk_size = 20  # BLE 4.0 default ATT_MTU - 3
+
+            # Small labels fit in a single ATT write; skip the chunk loop
+            if self._write_without_response and len(data) <= chunk_size:
+                await self.client.write_gatt_char(
+                    char, data, response=False
+                )
+                self._schedule_idle_disconnect()
+                return
+
+            if self._write_without_response:
+                # Issue writes concurrently so the backend can flush several
+                # PDUs per connection interval; a bounded semaphore keeps a
+                # handful in flight without overrunning the host buffer, and
+                # every 16th packet requests an ACK as flow control
+                semaphore = asyncio.Semaphore(8)
+
+                async def _write_chunk(chunk, response):
+                    async with semaphore:
+                        await self.client.write_gatt_char(
+                            char, chunk, response=response
+                        )
+
+                tasks = [
+                    _write_chunk(data[i:i + chunk_size], packet % 16 == 15)
+                    for packet, i in enumerate(range(0, len(data), chunk_size))
+                ]
+                await asyncio.gather(*tasks)
+            else:
+                for i in range(0, len(data), chunk_size):
+                    chunk = data[i:i + chunk_size]
+                    await self.client.write_gatt_char(char, chunk)
+                    await asyncio.sleep(0.05)  # Small delay between chunks
+
+            self._schedule_idle_disconnect()
+
         except Exception as err:
             _LOGGER.error("Error sending data to printer: %s", err)
             raise
@@ -357,7 +452,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.disconnect()
+    await coordinator.shutdown()
     
     # Remove services
     hass.services.async_remove(DOMAIN, SERVICE_PRINT_TEXT)
@@ -5,8 +5,12 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-from bleak import BleakScanner
 from homeassistant import config_entries
+from homeassistant.components.bluetooth import (
+    async_address_present,
+    async_discovered_service_info,
+    async_get_scanner,
+)
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
@@ -16,6 +20,25 @@ from .const import CONF_MAC_ADDRESS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+_MAC_SEPARATOR_INDICES = (2, 5, 8, 11, 14)
+
+# Lowercased name fragments that suggest a device is a printer
+_PRINTER_KEYWORDS = frozenset(
+    ['printer', 'thermal', 'pos', 'receipt', 'impressora', 'print']
+)
+
+
+def _device_label(address: str, name: str | None) -> str:
+    """Format a discovered device for the selection list."""
+    if not name:
+        return f"❓ {address}"
+    name_lc = name.lower()
+    # Prioritize devices that look like printers
+    if any(keyword in name_lc for keyword in _PRINTER_KEYWORDS):
+        return f"🖨 {name} ({address})"
+    return f"📱 {name} ({address})"
+
 STEP_USER_DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_MAC_ADDRESS): str,
     vol.Required(CONF_NAME, default="Impressora Térmica"): str,
@@ -49,14 +72,13 @@ class ThermalPrinterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(mac_address)
                 self._abort_if_unique_id_configured()
 
-                # Test connection
+                # Check reachability from the advertisement cache instead of
+                # a full connect/disconnect round trip, which blocks the form
+                # for about a second; the first print connects lazily anyway
                 try:
-                    from bleak import BleakClient
-                    client = BleakClient(mac_address)
-                    connected = await client.connect()
-                    if connected:
-                        await client.disconnect()
-                    else:
+                    if not async_address_present(
+                        self.hass, mac_address, connectable=True
+                    ):
                         errors["base"] = "cannot_connect"
                 except Exception:
                     errors["base"] = "cannot_connect"
@@ -96,24 +118,27 @@ class ThermalPrinterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Discover Bluetooth devices."""
         devices = {}
         try:
-            _LOGGER.info("Scanning for Bluetooth devices...")
-            scanner = BleakScanner()
-            bluetooth_devices = await scanner.discover(timeout=10.0)
-
-            printer_keywords = ['printer', 'thermal', 'pos', 'receipt', 'impressora', 'print']
+            # Home Assistant already runs a central BLE scanner; its cached
+            # advertisements are available instantly, so the user is not
+            # stuck behind a 10 s active scan every time the form renders
+            names = {
+                info.address: info.name
+                for info in async_discovered_service_info(self.hass)
+            }
 
-            for device in bluetooth_devices:
-                device_name = device.name or "Dispositivo Desconhecido"
-                device_address = device.address
+            if not names:
+                # No cached service info yet (e.g. scanner just started);
+                # read the shared scanner's device list rather than spinning
+                # up a private BleakScanner that would contend for the radio
+                scanner = async_get_scanner(self.hass)
+                names = {
+                    d.address: d.name for d in scanner.discovered_devices
+                }
 
-                # Prioritize devices that look like printers
-                if device.name and any(keyword in device.name.lower() 
-                                     for keyword in printer_keywords):
-                    devices[device_address] = f"🖨 {device_name} ({device_address})"
-                elif device.name:
-                    devices[device_address] = f"📱 {device_name} ({device_address})"
-                else:
-                    devices[device_address] = f"❓ {device_address}"
+            devices = {
+                address: _device_label(address, name)
+                for address, name in names.items()
+            }
 
             _LOGGER.info("Found %d Bluetooth devices", len(devices))
 
@@ -123,10 +148,18 @@ class ThermalPrinterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return devices
 
     def _is_valid_mac(self, mac: str) -> bool:
-        """Validate MAC address format."""
-        import re
-        mac_pattern = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
-        return bool(mac_pattern.match(mac))
+        """Validate MAC address format (AA:BB:CC:DD:EE:FF, : or -)."""
+        # Direct structural check on fixed positions; cheaper than
+        # dispatching into the regex engine for a 17-char string
+        return (
+            len(mac) == 17
+            and all(mac[i] in ':-' for i in _MAC_SEPARATOR_INDICES)
+            and all(
+                c in _HEX_DIGITS
+                for i, c in enumerate(mac)
+                if i % 3 != 2
+            )
+        )
 
     async def async_step_bluetooth(self, discovery_info):
         """Handle bluetooth discovery."""
@@ -27,3 +27,27 @@ ESC_BOLD_OFF = b'\x1B\x45\x00'
 ESC_SIZE_NORMAL = b'\x1D\x21\x00'
 ESC_SIZE_LARGE = b'\x1D\x21\x11'
 ESC_LINE_FEED = b'\x0A'
+
+# Lookup tables for text formatting options
+ALIGN = {
+    "left": ESC_ALIGN_LEFT,
+    "center": ESC_ALIGN_CENTER,
+    "right": ESC_ALIGN_RIGHT,
+}
+SIZE = {
+    "small": ESC_SIZE_NORMAL,
+    "normal": ESC_SIZE_NORMAL,
+    "large": ESC_SIZE_LARGE,
+}
+
+# The formatting options form a small finite set, so every control header
+# can be precomputed at import time instead of rebuilt on each print
+PROLOGUE = {
+    (alignment, size, bold): ESC_INIT + align_cmd + size_cmd
+    + (ESC_BOLD_ON if bold else b'')
+    for alignment, align_cmd in ALIGN.items()
+    for size, size_cmd in SIZE.items()
+    for bold in (False, True)
+}
+EPILOGUE = ESC_LINE_FEED + ESC_BOLD_OFF + ESC_SIZE_NORMAL + ESC_ALIGN_LEFT
+DEFAULT_PROLOGUE = PROLOGUE[(DEFAULT_ALIGNMENT, DEFAULT_FONT_SIZE, False)]